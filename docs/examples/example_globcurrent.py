@@ -31,7 +31,7 @@ def set_globcurrent_fieldset(
     else:
         dimensions = {"lat": "lat", "lon": "lon"}
     if use_xarray:
-        ds = xr.open_mfdataset(filename, combine="by_coords")
+        ds = xr.open_mfdataset(filename, combine="by_coords", parallel=True)
         return parcels.FieldSet.from_xarray_dataset(
             ds, variables, dimensions, time_periodic=time_periodic
         )
@@ -47,9 +47,26 @@ def set_globcurrent_fieldset(
         )
 
 
+@pytest.fixture(scope="session")
+def globcurrent_fieldset():
+    """Return a function that builds a GlobCurrent FieldSet once per value of use_xarray per session.
+
+    The FieldSets are shared between tests, so only tests that do not execute
+    particles on them (and hence do not advance their deferred-loaded data) should use them.
+    """
+    fieldsets = {}
+
+    def get_fieldset(use_xarray=False):
+        if use_xarray not in fieldsets:
+            fieldsets[use_xarray] = set_globcurrent_fieldset(use_xarray=use_xarray)
+        return fieldsets[use_xarray]
+
+    return get_fieldset
+
+
 @pytest.mark.parametrize("use_xarray", [True, False])
-def test_globcurrent_fieldset(use_xarray):
-    fieldset = set_globcurrent_fieldset(use_xarray=use_xarray)
+def test_globcurrent_fieldset(use_xarray, globcurrent_fieldset):
+    fieldset = globcurrent_fieldset(use_xarray=use_xarray)
     assert fieldset.U.lon.size == 81
     assert fieldset.U.lat.size == 41
     assert fieldset.V.lon.size == 81
@@ -116,22 +133,21 @@ def test_globcurrent_particles(mode, use_xarray):
 @pytest.mark.parametrize("mode", ["scipy", "jit"])
 @pytest.mark.parametrize("rundays", [300, 900])
 def test_globcurrent_time_periodic(mode, rundays):
+    MyParticle = ptype[mode].add_variable("sample_var", initial=0.0)
+
+    def SampleU(particle, fieldset, time):
+        u, v = fieldset.UV[time, particle.depth, particle.lat, particle.lon]
+        particle.sample_var += u
+
     sample_var = []
     for deferred_load in [True, False]:
         fieldset = set_globcurrent_fieldset(
             time_periodic=timedelta(days=365), deferred_load=deferred_load
         )
 
-        MyParticle = ptype[mode].add_variable("sample_var", initial=0.0)
-
         pset = parcels.ParticleSet(
             fieldset, pclass=MyParticle, lon=25, lat=-35, time=fieldset.U.grid.time[0]
         )
-
-        def SampleU(particle, fieldset, time):
-            u, v = fieldset.UV[time, particle.depth, particle.lat, particle.lon]
-            particle.sample_var += u
-
         pset.execute(SampleU, runtime=timedelta(days=rundays), dt=timedelta(days=1))
         sample_var.append(pset[0].sample_var)
 
@@ -179,8 +195,8 @@ def test_globcurrent_netcdf_timestamps(dt):
     assert np.allclose(psetN.lat[0], psetT.lat[0])
 
 
-def test__particles_init_time():
-    fieldset = set_globcurrent_fieldset()
+def test__particles_init_time(globcurrent_fieldset):
+    fieldset = globcurrent_fieldset()
 
     lonstart = [25]
     latstart = [-35]
@@ -289,22 +305,26 @@ def test_globcurrent_particle_independence(mode, rundays=5):
     fieldset = set_globcurrent_fieldset()
     time0 = fieldset.U.grid.time[0]
 
-    def DeleteP0(particle, fieldset, time):
-        if particle.id == 0:
+    MyParticle = ptype[mode].add_variable("delete_me", dtype=np.int32, initial=0)
+
+    def DeleteFlagged(particle, fieldset, time):
+        if particle.delete_me == 1:
             particle.delete()
 
     pset0 = parcels.ParticleSet(
-        fieldset, pclass=ptype[mode], lon=[25, 25], lat=[-35, -35], time=time0
+        fieldset, pclass=MyParticle, lon=[25, 25], lat=[-35, -35], time=time0
     )
+    # flag the first particle through a variable, as particle ids depend on earlier tests
+    pset0[0].delete_me = 1
 
     pset0.execute(
-        pset0.Kernel(DeleteP0) + parcels.AdvectionRK4,
+        pset0.Kernel(DeleteFlagged) + parcels.AdvectionRK4,
         runtime=timedelta(days=rundays),
         dt=timedelta(minutes=5),
     )
 
     pset1 = parcels.ParticleSet(
-        fieldset, pclass=ptype[mode], lon=[25, 25], lat=[-35, -35], time=time0
+        fieldset, pclass=MyParticle, lon=[25, 25], lat=[-35, -35], time=time0
     )
 
     pset1.execute(
@@ -317,8 +337,8 @@ def test_globcurrent_particle_independence(mode, rundays=5):
 @pytest.mark.parametrize("mode", ["scipy", "jit"])
 @pytest.mark.parametrize("dt", [-300, 300])
 @pytest.mark.parametrize("pid_offset", [0, 20])
-def test_globcurrent_pset_fromfile(mode, dt, pid_offset, tmpdir):
-    filename = tmpdir.join("pset_fromparticlefile.zarr")
+def test_globcurrent_pset_fromfile(mode, dt, pid_offset, tmp_path):
+    filename = tmp_path / "pset_fromparticlefile.zarr"
     fieldset = set_globcurrent_fieldset()
 
     ptype[mode].setLastID(pid_offset)
@@ -343,11 +363,11 @@ def test_globcurrent_pset_fromfile(mode, dt, pid_offset, tmpdir):
 
 
 @pytest.mark.parametrize("mode", ["scipy", "jit"])
-def test_error_outputdt_not_multiple_dt(mode, tmpdir):
+def test_error_outputdt_not_multiple_dt(mode, tmp_path):
     # Test that outputdt is a multiple of dt
     fieldset = set_globcurrent_fieldset()
 
-    filepath = tmpdir.join("pfile_error_outputdt_not_multiple_dt.zarr")
+    filepath = tmp_path / "pfile_error_outputdt_not_multiple_dt.zarr"
 
     dt = 81.2584344538292  # number for which output writing fails
 
@@ -20,6 +20,7 @@ from parcels.tools.converters import (
     UnitConverter,
     unitconverters_map,
 )
+from parcels.tools.loggers import logger
 from parcels.tools.statuscodes import (
     AllParcelsErrorCodes,
     FieldOutOfBoundError,
@@ -52,6 +53,15 @@ def _isParticle(key):
         return False
 
 
+def _zero_nans(data):
+    """Set the NaN values of data to zero, in place."""
+    if isinstance(data, np.ndarray):
+        # single in-place pass, without materialising a boolean mask
+        np.nan_to_num(data, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
+    else:
+        data[np.isnan(data)] = 0.0
+
+
 def _deal_with_errors(error, key, vector_type: VectorType):
     if _isParticle(key):
         key.state = AllParcelsErrorCodes[type(error)]
@@ -265,7 +275,7 @@ class Field:
             # Hack around the fact that NaN and ridiculously large values
             # propagate in SciPy's interpolators
             lib = np if isinstance(self.data, np.ndarray) else da
-            self.data[lib.isnan(self.data)] = 0.0
+            _zero_nans(self.data)
             if self.vmin is not None:
                 self.data[self.data < self.vmin] = 0.0
             if self.vmax is not None:
@@ -957,57 +967,35 @@ class Field:
         if grid.ydim > 1 and (y < grid.lonlat_minmax[2] or y > grid.lonlat_minmax[3]):
             raise FieldOutOfBoundError(x, y, z, field=self)
 
+        grid._update_search_coords()
+
+        # Cell indices of the previous search for this particle, which are reused if still valid
+        xi_prev, yi_prev = (particle.xi[self.igrid], particle.yi[self.igrid]) if particle else (-1, -1)
+
         if grid.xdim > 1:
-            if grid.mesh != "spherical":
-                lon_index = grid.lon < x
-                if lon_index.all():
-                    xi = len(grid.lon) - 2
-                else:
-                    xi = lon_index.argmin() - 1 if lon_index.any() else 0
-                xsi = (x - grid.lon[xi]) / (grid.lon[xi + 1] - grid.lon[xi])
-                if xsi < 0:
-                    xi -= 1
-                    xsi = (x - grid.lon[xi]) / (grid.lon[xi + 1] - grid.lon[xi])
-                elif xsi > 1:
-                    xi += 1
-                    xsi = (x - grid.lon[xi]) / (grid.lon[xi + 1] - grid.lon[xi])
-            else:
-                lon_fixed = grid.lon.copy()
-                indices = lon_fixed >= lon_fixed[0]
-                if not indices.all():
-                    lon_fixed[indices.argmin() :] += 360
-                if x < lon_fixed[0]:
-                    lon_fixed -= 360
-
-                lon_index = lon_fixed < x
-                if lon_index.all():
-                    xi = len(lon_fixed) - 2
-                else:
-                    xi = lon_index.argmin() - 1 if lon_index.any() else 0
-                xsi = (x - lon_fixed[xi]) / (lon_fixed[xi + 1] - lon_fixed[xi])
-                if xsi < 0:
-                    xi -= 1
-                    xsi = (x - lon_fixed[xi]) / (lon_fixed[xi + 1] - lon_fixed[xi])
-                elif xsi > 1:
-                    xi += 1
-                    xsi = (x - lon_fixed[xi]) / (lon_fixed[xi + 1] - lon_fixed[xi])
+            lon = grid._search_lon
+            # west of the first longitude, shift x instead of (a copy of) the longitudes
+            xs = x + 360 if grid.mesh == "spherical" and x < lon[0] else x
+            xi = grid._search_cell("lon", xs, xi_prev)
+            xsi = (xs - lon[xi]) * grid._search_lon_inv_dx[xi]
+            if xsi < 0:
+                xi -= 1
+                xsi = (xs - lon[xi]) * grid._search_lon_inv_dx[xi]
+            elif xsi > 1:
+                xi += 1
+                xsi = (xs - lon[xi]) * grid._search_lon_inv_dx[xi]
         else:
             xi, xsi = -1, 0
 
         if grid.ydim > 1:
-            lat_index = grid.lat < y
-            if lat_index.all():
-                yi = len(grid.lat) - 2
-            else:
-                yi = lat_index.argmin() - 1 if lat_index.any() else 0
-
-            eta = (y - grid.lat[yi]) / (grid.lat[yi + 1] - grid.lat[yi])
+            yi = grid._search_cell("lat", y, yi_prev)
+            eta = (y - grid.lat[yi]) * grid._search_lat_inv_dx[yi]
             if eta < 0:
                 yi -= 1
-                eta = (y - grid.lat[yi]) / (grid.lat[yi + 1] - grid.lat[yi])
+                eta = (y - grid.lat[yi]) * grid._search_lat_inv_dx[yi]
             elif eta > 1:
                 yi += 1
-                eta = (y - grid.lat[yi]) / (grid.lat[yi + 1] - grid.lat[yi])
+                eta = (y - grid.lat[yi]) * grid._search_lat_inv_dx[yi]
         else:
             yi, eta = -1, 0
 
@@ -1097,7 +1085,7 @@ class Field:
             (xi, yi) = self.reconnect_bnd_indices(xi, yi, grid.xdim, grid.ydim, grid.mesh)
             it += 1
             if it > maxIterSearch:
-                print("Correct cell not found after %d iterations" % maxIterSearch)
+                logger.warning(f"Correct cell not found after {maxIterSearch:.0f} iterations")
                 raise FieldOutOfBoundError(x, y, 0, field=self)
         xsi = max(0.0, xsi)
         eta = max(0.0, eta)
@@ -1132,8 +1120,10 @@ class Field:
         else:
             return self.search_indices_curvilinear(x, y, z, ti, time, particle=particle, search2D=search2D)
 
-    def interpolator2D(self, ti, z, y, x, particle=None):
-        (xsi, eta, _, xi, yi, _) = self.search_indices(x, y, z, particle=particle)
+    def interpolator2D(self, ti, z, y, x, particle=None, search_indices=None):
+        if search_indices is None:
+            search_indices = self.search_indices(x, y, z, particle=particle)
+        (xsi, eta, _, xi, yi, _) = search_indices
         if self.interp_method == "nearest":
             xii = xi if xsi <= 0.5 else xi + 1
             yii = yi if eta <= 0.5 else yi + 1
@@ -1183,8 +1173,10 @@ class Field:
         else:
             raise RuntimeError(self.interp_method + " is not implemented for 2D grids")
 
-    def interpolator3D(self, ti, z, y, x, time, particle=None):
-        (xsi, eta, zeta, xi, yi, zi) = self.search_indices(x, y, z, ti, time, particle=particle)
+    def interpolator3D(self, ti, z, y, x, time, particle=None, search_indices=None):
+        if search_indices is None:
+            search_indices = self.search_indices(x, y, z, ti, time, particle=particle)
+        (xsi, eta, zeta, xi, yi, zi) = search_indices
         if self.interp_method == "nearest":
             xii = xi if xsi <= 0.5 else xi + 1
             yii = yi if eta <= 0.5 else yi + 1
@@ -1293,12 +1285,16 @@ class Field:
             f1 = self.data[ti + 1, :]
             return f0 + (f1 - f0) * ((time - t0) / (t1 - t0))
 
-    def spatial_interpolation(self, ti, z, y, x, time, particle=None):
-        """Interpolate horizontal field values using a SciPy interpolator."""
+    def spatial_interpolation(self, ti, z, y, x, time, particle=None, search_indices=None):
+        """Interpolate horizontal field values using a SciPy interpolator.
+
+        The result of :func:`search_indices` can be passed as search_indices, to reuse
+        it for Fields on the same Grid (e.g. the components of a VectorField).
+        """
         if self.grid.zdim == 1:
-            val = self.interpolator2D(ti, z, y, x, particle=particle)
+            val = self.interpolator2D(ti, z, y, x, particle=particle, search_indices=search_indices)
         else:
-            val = self.interpolator3D(ti, z, y, x, time, particle=particle)
+            val = self.interpolator3D(ti, z, y, x, time, particle=particle, search_indices=search_indices)
         if np.isnan(val):
             # Detect Out-of-bounds sampling and raise exception
             raise FieldOutOfBoundError(x, y, z, field=self)
@@ -1363,18 +1359,20 @@ class Field:
         except tuple(AllParcelsErrorCodes.keys()) as error:
             return _deal_with_errors(error, key, vector_type=None)
 
-    def eval(self, time, z, y, x, particle=None, applyConversion=True):
+    def eval(self, time, z, y, x, particle=None, applyConversion=True, search_indices=None):
         """Interpolate field values in space and time.
 
         We interpolate linearly in time and apply implicit unit
         conversion to the result. Note that we defer to
         scipy.interpolate to perform spatial interpolation.
+        On a 2D grid, the result of :func:`search_indices` can be passed as search_indices,
+        as it does not depend on the time index.
         """
         (ti, periods) = self.time_index(time)
         time -= periods * (self.grid.time_full[-1] - self.grid.time_full[0])
         if ti < self.grid.tdim - 1 and time > self.grid.time[ti]:
-            f0 = self.spatial_interpolation(ti, z, y, x, time, particle=particle)
-            f1 = self.spatial_interpolation(ti + 1, z, y, x, time, particle=particle)
+            f0 = self.spatial_interpolation(ti, z, y, x, time, particle=particle, search_indices=search_indices)
+            f1 = self.spatial_interpolation(ti + 1, z, y, x, time, particle=particle, search_indices=search_indices)
             t0 = self.grid.time[ti]
             t1 = self.grid.time[ti + 1]
             value = f0 + (f1 - f0) * ((time - t0) / (t1 - t0))
@@ -1382,7 +1380,9 @@ class Field:
             # Skip temporal interpolation if time is outside
             # of the defined time range or if we have hit an
             # exact value in the time array.
-            value = self.spatial_interpolation(ti, z, y, x, self.grid.time[ti], particle=particle)
+            value = self.spatial_interpolation(
+                ti, z, y, x, self.grid.time[ti], particle=particle, search_indices=search_indices
+            )
 
         if applyConversion:
             return self.units.to_target(value, x, y, z)
@@ -1578,11 +1578,11 @@ class Field:
         # Create DataArray objects for file I/O
         if self.grid.gtype == GridType.RectilinearZGrid:
             nav_lon = xr.DataArray(
-                self.grid.lon + np.zeros((self.grid.ydim, self.grid.xdim), dtype=np.float32),
+                np.broadcast_to(self.grid.lon, (self.grid.ydim, self.grid.xdim)),
                 coords=[("y", self.grid.lat), ("x", self.grid.lon)],
             )
             nav_lat = xr.DataArray(
-                self.grid.lat.reshape(self.grid.ydim, 1) + np.zeros(self.grid.xdim, dtype=np.float32),
+                np.broadcast_to(self.grid.lat[:, np.newaxis], (self.grid.ydim, self.grid.xdim)),
                 coords=[("y", self.grid.lat), ("x", self.grid.lon)],
             )
         elif self.grid.gtype == GridType.CurvilinearZGrid:
@@ -1604,10 +1604,12 @@ class Field:
             coords={"nav_lon": nav_lon, "nav_lat": nav_lat, "time_counter": time_counter, vname_depth: self.grid.depth},
             attrs=attrs,
         )
-        dset.to_netcdf(filepath, unlimited_dims="time_counter")
+        # one uncompressed chunk per time and depth level, matching how Fields are read back (per time slice)
+        encoding = {varname: {"chunksizes": (1, 1, self.grid.ydim, self.grid.xdim), "zlib": False}}
+        dset.to_netcdf(filepath, engine="netcdf4", unlimited_dims="time_counter", encoding=encoding)
 
     def rescale_and_set_minmax(self, data):
-        data[np.isnan(data)] = 0
+        _zero_nans(data)
         if self._scaling_factor:
             data *= self._scaling_factor
         if self.vmin is not None:
@@ -2162,8 +2164,13 @@ class VectorField:
 
     def eval(self, time, z, y, x, particle=None, applyConversion=True):
         if self.U.interp_method not in ["cgrid_velocity", "partialslip", "freeslip"]:
-            u = self.U.eval(time, z, y, x, particle=particle, applyConversion=False)
-            v = self.V.eval(time, z, y, x, particle=particle, applyConversion=False)
+            search_indices = None
+            if self.vector_type == "2D" and self.U.grid is self.V.grid and self.U.grid.zdim == 1:
+                # On a shared 2D grid, the index search depends neither on the Field nor on the time index,
+                # so it is done once for U and V. This is checked at every eval, as the grids can be changed.
+                search_indices = self.U.search_indices(x, y, z, particle=particle)
+            u = self.U.eval(time, z, y, x, particle=particle, applyConversion=False, search_indices=search_indices)
+            v = self.V.eval(time, z, y, x, particle=particle, applyConversion=False, search_indices=search_indices)
             if applyConversion:
                 u = self.U.units.to_target(u, x, y, z)
                 v = self.V.units.to_target(v, x, y, z)
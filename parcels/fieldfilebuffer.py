@@ -121,20 +121,17 @@ class NetcdfFileBuffer(_FileBuffer):
                 lat_subset = np.array(lat[0, 0, self.indices["lat"], self.indices["lon"]])
 
         if len(lon.shape) > 1:  # Tests if lon, lat are rectilinear but were stored in arrays
-            rectilinear = True
             # test if all columns and rows are the same for lon and lat (in which case grid is rectilinear)
-            for xi in range(1, lon_subset.shape[0]):
-                if not np.allclose(lon_subset[0, :], lon_subset[xi, :]):
-                    rectilinear = False
-                    break
+            # first compare the first two rows/columns only, to cheaply reject the common curvilinear case
+            rectilinear = (lon_subset.shape[0] < 2 or np.allclose(lon_subset[0, :], lon_subset[1, :])) and (
+                lat_subset.shape[1] < 2 or np.allclose(lat_subset[:, 0], lat_subset[:, 1])
+            )
             if rectilinear:
-                for yi in range(1, lat_subset.shape[1]):
-                    if not np.allclose(lat_subset[:, 0], lat_subset[:, yi]):
-                        rectilinear = False
-                        break
+                rectilinear = np.allclose(lon_subset[0, :], lon_subset) and np.allclose(lat_subset[:, :1], lat_subset)
             if rectilinear:
-                lon_subset = lon_subset[0, :]
-                lat_subset = lat_subset[:, 0]
+                # copies, so that the full 2D coordinate arrays are not kept alive by strided views
+                lon_subset = lon_subset[0, :].copy()
+                lat_subset = lat_subset[:, 0].copy()
         return lon_subset, lat_subset
 
     @property
@@ -22,6 +22,34 @@ __all__ = [
 ]
 
 
+# Maximum size of an index lookup table, relative to the size of the coordinate vector it indexes
+_LOOKUP_TABLE_MAX_RATIO = 64
+
+
+def _index_lookup_table(coords):
+    """Build a lookup table for O(1) localisation in a strictly increasing coordinate vector.
+
+    The table overlays coords with a homogeneous grid, spaced by the smallest interval of coords.
+    Each entry holds the number of nodes below the start of its overlay cell, so that at most one
+    more node lies between the start of an overlay cell and any position within it.
+
+    Returns a tuple (origin, inverse spacing, table), or None if coords is not strictly increasing
+    or if the grid is so irregular that the table would become too large.
+    """
+    if coords.size < 2:
+        return None
+    dx = np.diff(coords.astype(np.float64))
+    if not np.all(dx > 0):
+        return None
+    step = dx.min()
+    size = int((float(coords[-1]) - float(coords[0])) / step) + 1
+    if size > _LOOKUP_TABLE_MAX_RATIO * coords.size:
+        return None
+    origin = float(coords[0])
+    table = np.searchsorted(coords, origin + np.arange(size) * step, side="left").astype(np.int32)
+    return origin, 1.0 / step, table
+
+
 class GridType(IntEnum):
     RectilinearZGrid = 0
     RectilinearSGrid = 1
@@ -359,6 +387,74 @@ class RectilinearGrid(Grid):
                 FieldSetWarning,
                 stacklevel=2,
             )
+        self._search_src = None
+
+    def _update_search_coords(self):
+        """Rebuild the search coordinates if lon or lat has been reassigned since they were last computed."""
+        if self._search_src is None or self._search_src[0] is not self.lon or self._search_src[1] is not self.lat:
+            self._set_search_coords()
+
+    def _set_search_coords(self):
+        """Precompute the coordinate vectors used by the index search in scipy mode.
+
+        On a spherical mesh, the longitudes are unwrapped across the antimeridian once here,
+        instead of copying and unwrapping them in every call of Field.search_indices_rectilinear.
+        This is done lazily, on the first search after grid.lon or grid.lat is (re)assigned, so that
+        JIT-only runs never allocate these arrays. The source arrays are stored to detect such reassignments.
+        """
+        self._search_src = (self.lon, self.lat)
+        lon = self.lon
+        if self.mesh == "spherical" and lon.size > 1:
+            lon = lon.copy()
+            indices = lon >= lon[0]
+            if not indices.all():
+                lon[indices.argmin() :] += 360
+        self._search_lon = np.ascontiguousarray(lon)
+        self._search_lat = np.ascontiguousarray(self.lat)
+        self._search_lon_lut = _index_lookup_table(self._search_lon)
+        self._search_lat_lut = _index_lookup_table(self._search_lat)
+        self._search_lon_sorted = bool(np.all(np.diff(self._search_lon) >= 0))
+        self._search_lat_sorted = bool(np.all(np.diff(self._search_lat) >= 0))
+        # inverse cell widths, so that the relative position in a cell is a multiplication instead of a division
+        with np.errstate(divide="ignore"):
+            self._search_lon_inv_dx = 1.0 / np.diff(self._search_lon.astype(np.float64))
+            self._search_lat_inv_dx = 1.0 / np.diff(self._search_lat.astype(np.float64))
+
+    def _search_cell(self, axis, x, guess=-1):
+        """Return the index i of the cell such that coords[i] < x <= coords[i+1] along axis ('lon' or 'lat').
+
+        The index is clipped to the range [0, size-2]. A guess (typically the cell index found for
+        the same particle in the previous call) is returned directly if it still holds x.
+        Otherwise, when a lookup table is available, the cell is found with one table access
+        and a probe of the neighbouring node. Sorted coordinates without a lookup table (e.g.
+        strongly irregular grids) are searched with a binary search, other ones with a linear scan.
+        """
+        coords = self._search_lon if axis == "lon" else self._search_lat
+        lut = self._search_lon_lut if axis == "lon" else self._search_lat_lut
+        last = len(coords) - 2
+        if 0 <= guess <= last and (guess == 0 or coords[guess] < x) and (guess == last or x <= coords[guess + 1]):
+            return guess
+        if lut is None:
+            if self._search_lon_sorted if axis == "lon" else self._search_lat_sorted:
+                return min(max(int(np.searchsorted(coords, x, side="left")) - 1, 0), last)
+            index = coords < x
+            if index.all():
+                return last
+            return index.argmin() - 1 if index.any() else 0
+
+        origin, inv_step, table = lut
+        j = (x - origin) * inv_step
+        if j >= len(table):
+            count = table[-1]
+        elif j > 0:
+            count = table[int(j)]
+        else:
+            count = 0
+        while count < len(coords) and coords[count] < x:
+            count += 1
+        while count > 0 and coords[count - 1] >= x:
+            count -= 1
+        return min(max(count - 1, 0), last)
 
     def add_periodic_halo(self, zonal: bool, meridional: bool, halosize: int = 5):
         """Add a 'halo' to the Grid, through extending the Grid (and lon/lat)
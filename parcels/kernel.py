@@ -63,6 +63,8 @@ class BaseKernel(abc.ABC):
         self.field_args = None
         self.const_args = None
         self._ptype = ptype
+        # whether the Scipy update loop should cap next_dt (set by AdvectionRK45) instead of dt
+        self._use_next_dt = "next_dt" in [v.name for v in ptype.variables]
         self._lib = None
         self.delete_cfiles = delete_cfiles
         self._c_include = c_include
@@ -618,7 +620,11 @@ class Kernel(BaseKernel):
             for f in self.fieldset.get_fields():
                 if isinstance(f, (VectorField, NestedField)):
                     continue
-                f.data = np.array(f.data)
+                if isinstance(f.data, np.ndarray):
+                    # no-op for data that is already a contiguous array, instead of a full copy at every execute
+                    f.data = np.ascontiguousarray(f.data)
+                else:
+                    f.data = np.array(f.data)
 
         if not self.scipy_positionupdate_kernels_added:
             self.add_scipy_positionupdate_kernels()
@@ -715,12 +721,11 @@ class Kernel(BaseKernel):
             if sign_dt * p.time_nextloop >= sign_dt * endtime:
                 return p
 
-            try:  # Use next_dt from AdvectionRK45 if it is set
+            if self._use_next_dt:  # Use next_dt from AdvectionRK45 if it is set
                 if abs(endtime - p.time_nextloop) < abs(p.next_dt) - 1e-6:
                     p.next_dt = abs(endtime - p.time_nextloop) * sign_dt
-            except KeyError:
-                if abs(endtime - p.time_nextloop) < abs(p.dt) - 1e-6:
-                    p.dt = abs(endtime - p.time_nextloop) * sign_dt
+            elif abs(endtime - p.time_nextloop) < abs(p.dt) - 1e-6:
+                p.dt = abs(endtime - p.time_nextloop) * sign_dt
             res = self._pyfunc(p, self._fieldset, p.time_nextloop)
 
             if res is None:
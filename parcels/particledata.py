@@ -52,6 +52,7 @@ class ParticleData:
         self._ptype = None
         self._latlondepth_dtype = np.float32
         self._data = None
+        self._buffers = {}
 
         assert pid_orig is not None, "particle IDs are None - incompatible with the ParticleData class. Invalid state."
         pid = pid_orig + pclass.lastID
@@ -275,19 +276,38 @@ class ParticleData:
         if self._ncount == 0:
             self._data = same_class._data
             self._ncount = same_class._ncount
+            self._buffers = {}
             return
 
         # Determine order of concatenation and update the sorted flag
         if self._sorted and same_class._sorted and self._data["id"][0] > same_class._data["id"][-1]:
             for d in self._data:
                 self._data[d] = np.concatenate((same_class._data[d], self._data[d]))
+            self._buffers = {}
             self._ncount += same_class._ncount
         else:
             if not (same_class._sorted and self._data["id"][-1] < same_class._data["id"][0]):
                 self._sorted = False
-            for d in self._data:
-                self._data[d] = np.concatenate((self._data[d], same_class._data[d]))
-            self._ncount += same_class._ncount
+            self._append(same_class)
+
+    def _append(self, same_class):
+        """Append the particles of another ParticleData instance at the end of this one.
+
+        The data arrays are views on buffers whose capacity grows geometrically, so that repeatedly
+        adding particles (e.g. with repeatdt) costs amortised O(1) per particle, instead of copying
+        all data arrays at every addition.
+        """
+        ncount = self._ncount + same_class._ncount
+        for d in self._data:
+            buffer = self._buffers.get(d)
+            if buffer is None or self._data[d].base is not buffer or len(buffer) < ncount:
+                capacity = max(ncount, 2 * self._ncount)
+                buffer = np.empty((capacity,) + self._data[d].shape[1:], dtype=self._data[d].dtype)
+                buffer[: self._ncount] = self._data[d]
+                self._buffers[d] = buffer
+            buffer[self._ncount : ncount] = same_class._data[d]
+            self._data[d] = buffer[:ncount]
+        self._ncount = ncount
 
     def __iadd__(self, instance):
         """Perform an incremental addition of ParticleData instances, such to allow a += b."""
@@ -304,6 +324,8 @@ class ParticleData:
 
         for d in self._data:
             self._data[d] = np.delete(self._data[d], index, axis=0)
+        # release the append buffers, which no longer back the data arrays
+        self._buffers = {}
 
         self._ncount -= 1
 
@@ -328,6 +350,8 @@ class ParticleData:
 
         for d in self._data:
             self._data[d] = np.delete(self._data[d], indices, axis=0)
+        # release the append buffers, which no longer back the data arrays
+        self._buffers = {}
 
         self._ncount -= len(indices)
 
@@ -114,6 +114,25 @@ def test_fieldset_sample_eval(fieldset):
     assert np.allclose(u_s, lat, rtol=1e-5)
 
 
+def test_fieldset_sample_eval_UV_matches_U_V():
+    """Sampling UV on a shared grid gives the same result as sampling U and V separately."""
+    lon = np.linspace(0, 10, 11, dtype=np.float32)
+    lat = np.linspace(0, 5, 6, dtype=np.float32)
+    time = np.array([0.0, 10.0])
+    U = np.random.default_rng(0).random((time.size, lat.size, lon.size), dtype=np.float32)
+    V = np.random.default_rng(1).random((time.size, lat.size, lon.size), dtype=np.float32)
+    fieldset = FieldSet.from_data({"U": U, "V": V}, {"lon": lon, "lat": lat, "time": time})
+    fieldset.computeTimeChunk(0, 1)
+    points = [(0.0, 2.5, 3.3), (4.0, 0.1, 9.9), (10.0, 4.7, 0.2)]
+
+    for interp_method in ["linear", "nearest"]:
+        fieldset.U.interp_method = interp_method
+        for t, y, x in points:
+            u, v = fieldset.UV.eval(t, 0, y, x)
+            assert u == fieldset.U.eval(t, 0, y, x)
+            assert v == fieldset.V.eval(t, 0, y, x)
+
+
 @pytest.mark.parametrize("mode", ["scipy", "jit"])
 def test_fieldset_polar_with_halo(fieldset_geometric_polar, mode):
     fieldset_geometric_polar.add_periodic_halo(zonal=5)
@@ -140,6 +140,37 @@ def test_avoid_repeated_grids():
     assert fieldset.V.grid is not fieldset.U.grid
 
 
+@pytest.mark.parametrize("mesh", ["flat", "spherical"])
+@pytest.mark.parametrize("min_spacing", [0.1, 1e-4])  # second value is too irregular for a lookup table
+def test_rectilinear_search_indices_irregular(mesh, min_spacing):
+    rng = np.random.default_rng(1234)
+    dlon = rng.uniform(0.1, 2.0, 40)
+    dlon[10] = min_spacing
+    lon = (np.cumsum(dlon) - 20).astype(np.float32)
+    lat = np.linspace(-60, 60, 31, dtype=np.float32) + rng.uniform(-1.0, 1.0, 31).astype(np.float32)
+    field = Field("U", np.zeros((lat.size, lon.size), dtype=np.float32), lon=lon, lat=lat, mesh=mesh)
+
+    xs = np.concatenate([lon, rng.uniform(lon[0], lon[-1], 200).astype(np.float32)])
+    ys = np.concatenate([lat, rng.uniform(lat[0], lat[-1], 200 + lon.size - lat.size).astype(np.float32)])
+    for x, y in zip(xs, ys, strict=True):
+        xsi, eta, _, xi, yi, _ = field.search_indices(x, y, 0)
+        assert lon[xi] <= x <= lon[xi + 1]
+        assert lat[yi] <= y <= lat[yi + 1]
+        assert np.isclose(lon[xi] + xsi * (lon[xi + 1] - lon[xi]), x, atol=1e-5)
+        assert np.isclose(lat[yi] + eta * (lat[yi + 1] - lat[yi]), y, atol=1e-5)
+
+
+def test_rectilinear_search_indices_after_reassigning_lon():
+    lon = np.linspace(0, 10, 11, dtype=np.float32)
+    lat = np.linspace(0, 5, 6, dtype=np.float32)
+    field = Field("U", np.zeros((lat.size, lon.size), dtype=np.float32), lon=lon, lat=lat, mesh="flat")
+    assert field.search_indices(2.5, 1.5, 0)[3:5] == (2, 1)
+
+    field.grid.lon = lon * 2
+    field.grid.lat = lat * 2
+    assert field.search_indices(2.5, 1.5, 0)[3:5] == (1, 0)
+
+
 @pytest.mark.parametrize("mode", ["scipy", "jit"])
 def test_multigrids_pointer(mode):
     lon_g0 = np.linspace(0, 1e4, 21, dtype=np.float32)
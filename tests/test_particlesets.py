@@ -295,6 +295,21 @@ def test_pset_add_execute(fieldset, mode):
     assert np.allclose(np.array([p.lat for p in pset]), 0.4, rtol=1e-12)
 
 
+@pytest.mark.parametrize("mode", ["scipy", "jit"])
+def test_pset_add_after_remove(fieldset, mode):
+    npart = 10
+    lon = np.linspace(0, 1, npart, dtype=np.float32)
+    pset = ParticleSet(fieldset, lon=[], lat=[], pclass=ptype[mode])
+    for i in range(npart):
+        pset.add(ParticleSet(pclass=ptype[mode], lon=lon[i], lat=0.5, fieldset=fieldset))
+    pset.remove_indices([0, 5])
+    for i in range(2):
+        pset.add(ParticleSet(pclass=ptype[mode], lon=lon[i], lat=0.5, fieldset=fieldset))
+    assert pset.size == npart
+    assert np.allclose(pset.lon, np.concatenate((lon[1:5], lon[6:], lon[:2])), rtol=1e-12)
+    assert np.all(np.diff(pset.id) > 0)
+
+
 @pytest.mark.parametrize("mode", ["scipy", "jit"])
 def test_pset_merge_inplace(fieldset, mode):
     npart = 100